@@ -28,19 +28,31 @@ SCRAPING_CONFIG = {
     "network_settle_time": 0.5,    # Wait for network to settle after navigation
     
     # Output settings
-    "output_file": "data.json",
+    "output_file": "data",         # Base name; the extension follows output_format
+    "output_format": "jsonl",      # "jsonl" (data.jsonl, one card per line) or "json" (data.json)
     "output_folder": "output",
     "pretty_print": True,
     "include_metadata": True,
     "live_save": True,
+    "flush_interval": 10,          # Pages buffered in memory between live-saves
     
     # Resume functionality
     "enable_resume": True,
     "resume_file": "process.json",
+    "cursor_file": ".scraped_pages",  # Append-only list of completed pages
+    
+    # URL result cache (skips re-navigating pages already extracted)
+    "enable_cache": True,
+    "cache_file": ".cache.sqlite",
+    "cache_ttl": 24 * 60 * 60,     # Seconds before a cached result expires (None = never)
     
     # Performance settings
     "retry_attempts": 3,
     "retry_delay": 1.0,
+    "max_concurrency": 5,          # Pages scraped in parallel (one browser tab each)
+    "ramp_up_after": 20,           # Successful navigations before raising a backed-off limit by one
+    "throttle_delay": 5.0,         # Wait after a 429/5xx without a Retry-After header (seconds)
+    "max_throttle_delay": 60.0,    # Upper bound on any Retry-After wait (seconds)
 }
 
 # ============================================================================
@@ -67,7 +79,16 @@ BROWSER_CONFIG = {
         "--disable-features=VizDisplayCompositor",
     ],
     
-    # Additional headers
+    # Skip image downloads and video autoplay (cards are read from meta tags and links only).
+    # Launch flags are used rather than request routing: routing disables the browser's
+    # HTTP cache, so every page would re-download the site's JS/CSS bundles.
+    "block_media": True,
+    "media_blocking_args": [
+        "--blink-settings=imagesEnabled=false",
+        "--autoplay-policy=user-gesture-required",
+    ],
+    
+    # Additional headers (compressed transfer is negotiated via Accept-Encoding)
     "extra_headers": {
         "Accept-Language": "en-US,en;q=0.9",
         "Accept-Encoding": "gzip, deflate, br",
@@ -239,6 +260,7 @@ PERFORMANCE_CONFIG = {
 from pathlib import Path
 OUTPUT_DIR = Path(SCRAPING_CONFIG["output_folder"])
 LOG_DIR = Path("logs")
+DATA_FILE = OUTPUT_DIR / f"{SCRAPING_CONFIG['output_file']}.{SCRAPING_CONFIG['output_format']}"
 
 # Validation
 REQUIRED_FIELDS = DATA_CONFIG["validate_required_fields"]
@@ -269,6 +291,18 @@ def validate_config():
         SCRAPING_CONFIG["start_page"] > SCRAPING_CONFIG["end_page"]):
         errors.append("start_page cannot be greater than end_page")
     
+    # Validate concurrency
+    if SCRAPING_CONFIG["max_concurrency"] < 1:
+        errors.append("max_concurrency must be at least 1")
+    
+    # Validate output format
+    if SCRAPING_CONFIG["output_format"] not in ("jsonl", "json"):
+        errors.append("output_format must be 'jsonl' or 'json'")
+    
+    # Validate live-save batching
+    if SCRAPING_CONFIG["flush_interval"] < 1:
+        errors.append("flush_interval must be at least 1")
+    
     # Validate timeouts
     if SCRAPING_CONFIG["max_wait_timeout"] < 5000:
         errors.append("max_wait_timeout should be at least 5 seconds")
@@ -10,6 +10,7 @@ Usage:
     python main.py                    # Smart scraping with default settings
     python main.py --start 1 --end 5 # Smart scrape pages 1-5
     python main.py --resume           # Resume with smart waiting
+    python main.py --yes              # Start without the confirmation prompt
     python main.py --summary          # Show summary with wait analytics
 
 Author: Senior Developer
@@ -18,7 +19,10 @@ Version: 1.0.0-advanced
 
 import asyncio
 import argparse
+import contextlib
+import signal
 import sys
+import threading
 import time
 import warnings
 from pathlib import Path
@@ -26,8 +30,6 @@ from pathlib import Path
 # Add the current directory to Python path for imports
 sys.path.append(str(Path(__file__).parent))
 
-from scraper import AdvancedShoobCardScraper
-
 
 def suppress_asyncio_warnings():
     """Suppress Windows-specific asyncio warnings that don't affect functionality."""
@@ -45,6 +47,20 @@ def suppress_asyncio_warnings():
         os.environ["PYTHONWARNINGS"] = "ignore::ResourceWarning"
 
 
+def setup_event_loop_policy():
+    """Select the fastest event loop available for this platform."""
+    if sys.platform == "win32":
+        # Proactor loop is required for Playwright's subprocess pipes on Windows
+        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+    else:
+        # uvloop is optional; fall back to the default selector loop
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
+
+
 def parse_arguments():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
@@ -55,6 +71,7 @@ Examples:
   python main.py                     # Smart scraping with defaults
   python main.py --start 1 --end 10 # Smart scrape pages 1-10
   python main.py --resume            # Resume with smart waiting
+  python main.py --yes               # Skip the confirmation prompt
   python main.py --summary           # Show summary with analytics
         """
     )
@@ -77,6 +94,12 @@ Examples:
         help="Resume scraping (skip existing pages)"
     )
     
+    parser.add_argument(
+        "--yes", "-y",
+        action="store_true",
+        help="Start scraping without asking for confirmation"
+    )
+    
     parser.add_argument(
         "--summary",
         action="store_true", 
@@ -92,6 +115,90 @@ Examples:
     return parser.parse_args()
 
 
+async def async_input(prompt):
+    """Read a line from stdin without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def _set_result(result):
+        if not future.done():
+            future.set_result(result)
+    
+    def _set_exception(exc):
+        if not future.done():
+            future.set_exception(exc)
+    
+    def _read():
+        try:
+            result = input(prompt)
+        except BaseException as e:
+            loop.call_soon_threadsafe(_set_exception, e)
+        else:
+            loop.call_soon_threadsafe(_set_result, result)
+    
+    # Daemon thread so an unanswered prompt never blocks interpreter exit
+    threading.Thread(target=_read, daemon=True).start()
+    return await future
+
+
+def install_shutdown_handlers(stop_event):
+    """Set stop_event on SIGINT/SIGTERM so workers finish in-flight pages and flush (POSIX only)."""
+    if sys.platform == "win32":
+        return  # add_signal_handler is unavailable; KeyboardInterrupt handling still applies
+    
+    loop = asyncio.get_running_loop()
+    
+    def request_shutdown(sig):
+        print(f"\n⚠️ {sig.name} received - finishing in-flight pages, then saving (repeat to force quit)")
+        stop_event.set()
+        loop.remove_signal_handler(sig)  # A second signal falls back to the default behaviour
+    
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, request_shutdown, sig)
+
+
+def remove_shutdown_handlers():
+    """Restore default SIGINT/SIGTERM handling after scraping."""
+    if sys.platform == "win32":
+        return
+    
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.remove_signal_handler(sig)
+
+
+async def shutdown_scraper(scraper):
+    """Flush buffered pages and close the browser, reporting any failure."""
+    try:
+        scraper.flush()
+    except Exception as e:
+        print(f"⚠️ Could not flush buffered pages: {e}")
+    
+    try:
+        await scraper._cleanup_browser()
+    except Exception as e:
+        print(f"⚠️ Browser cleanup failed: {e}")
+
+
+def create_progress():
+    """Create a single live progress bar, or None when rich is not installed."""
+    try:
+        from rich.progress import (
+            BarColumn, MofNCompleteColumn, Progress, TextColumn,
+            TimeElapsedColumn, TimeRemainingColumn
+        )
+    except ImportError:
+        return None
+    
+    return Progress(
+        TextColumn("{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TimeElapsedColumn(),
+        TimeRemainingColumn(),
+    )
+
+
 def print_banner():
     """Print application banner."""
     banner = """
@@ -103,7 +210,7 @@ def print_banner():
 ║  • Event-driven waiting (no fixed delays)                    ║
 ║  • Smart element detection & adaptive timeouts               ║
 ║  • Maximum efficiency with browser reliability               ║
-║  • Live-save functionality (saves after each page)           ║
+║  • Live-save functionality (batched page saves)              ║
 ║  • Resume capability with wait time analytics                ║
 ║  • Performance tracking & optimization                       ║
 ╚══════════════════════════════════════════════════════════════╝
@@ -140,16 +247,16 @@ async def main():
     
     # Setup Windows-specific fixes
     suppress_asyncio_warnings()  # Call this first
-    if sys.platform == "win32":
-        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
     
     # Print banner
     print_banner()
     
     try:
-        # Initialize scraper
+        # Initialize scraper (imported here so --help never pays for it)
+        from scraper import AdvancedShoobCardScraper
+        
         print("🔧 Initializing advanced event-driven scraper...")
-        scraper = AdvancedShoobCardScraper()
+        scraper = AdvancedShoobCardScraper(verbose=args.verbose)
         
         # Handle summary request
         if args.summary:
@@ -160,8 +267,6 @@ async def main():
         
         # Configure verbose logging if requested
         if args.verbose:
-            import logging
-            logging.getLogger().setLevel(logging.DEBUG)
             print("🔍 Verbose logging enabled")
         
         # Determine scraping parameters
@@ -169,7 +274,7 @@ async def main():
         end_page = args.end
         
         if args.resume:
-            print("🔄 Resume mode enabled - will skip existing pages")
+            print("🔄 Resume mode enabled - will skip existing pages and reuse cached results")
         
         # Display scraping plan
         print(f"\n📋 Smart Scraping Plan:")
@@ -187,19 +292,20 @@ async def main():
             else:
                 print(f"   End page: Auto-detect (will scrape until no more cards)")
         
+        print(f"   Concurrency: {scraper.config['max_concurrency']} pages in parallel")
         print(f"   Method: Event-driven smart waiting")
-        print(f"   Live-save: ✅ Enabled")
+        print(f"   Live-save: ✅ Enabled (every {scraper.config['flush_interval']} pages)")
         print(f"   Wait analytics: ✅ Enabled")
-        print(f"   Output: {scraper.config['output_folder']}/{scraper.config['output_file']}")
+        print(f"   Output: {scraper.data_file}")
         
         # Confirm before starting
-        if not args.resume:
+        if not args.yes and not args.resume:
             try:
-                response = input("\n🚀 Ready to start smart scraping? (y/N): ").strip().lower()
+                response = (await async_input("\n🚀 Ready to start smart scraping? (y/N): ")).strip().lower()
                 if response not in ['y', 'yes']:
                     print("❌ Scraping cancelled by user")
                     return
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, EOFError):
                 print("\n❌ Scraping cancelled by user")
                 return
         
@@ -209,8 +315,26 @@ async def main():
         
         start_time = time.time()
         
+        progress = create_progress()
+        
+        # Stop gracefully on SIGINT/SIGTERM: finish in-flight pages, then flush
+        stop_event = asyncio.Event()
+        install_shutdown_handlers(stop_event)
+        
         try:
-            stats = await scraper.scrape_all_pages(start_page, end_page)
+            with progress if progress is not None else contextlib.nullcontext():
+                on_page_done = None
+                if progress is not None:
+                    # Print scraper log lines above the live bar instead of through it
+                    scraper.set_log_stream(sys.stdout)
+                    task = progress.add_task("🚀 Scraping pages", total=None)
+                    
+                    def on_page_done(page_num, total_pages):
+                        progress.update(task, total=total_pages, advance=1)
+                
+                stats = await scraper.scrape_all_pages(
+                    start_page, end_page, on_page_done=on_page_done, stop_event=stop_event
+                )
         except Exception as e:
             print(f"\n❌ Scraping error: {e}")
             # Create fallback stats if scraping fails
@@ -219,6 +343,7 @@ async def main():
                 'pages_skipped': 0,
                 'cards_extracted': len(scraper.all_cards) if hasattr(scraper, 'all_cards') else 0,
                 'total_errors': scraper.stats.get('errors', 0) if hasattr(scraper, 'stats') else 0,
+                'throttled': scraper.stats.get('throttled', 0) if hasattr(scraper, 'stats') else 0,
                 'success_rate': 0,
                 'elapsed_time': time.time() - start_time,
                 'cards_per_second': 0,
@@ -230,6 +355,14 @@ async def main():
                     'wait_efficiency': 0
                 }
             }
+        finally:
+            # The live display has stopped; point logging back at the real stdout
+            scraper.set_log_stream(sys.stdout)
+            remove_shutdown_handlers()
+        
+        if stop_event.is_set():
+            print("\n⚠️ Scraping stopped early by signal - completed pages have been saved")
+            print("🔄 Use --resume flag to continue from where you left off")
         
         # Display final results
         print("\n" + "="*60)
@@ -237,8 +370,10 @@ async def main():
         print("="*60)
         print(f"📄 Pages scraped: {stats.get('pages_scraped', 0)}")
         print(f"📄 Pages skipped: {stats.get('pages_skipped', 0)}")
+        print(f"🗄️ Cache hits: {stats.get('cache_hits', 0)} (misses: {stats.get('cache_misses', 0)})")
         print(f"🃏 Cards extracted: {stats.get('cards_extracted', 0)}")
         print(f"❌ Errors: {stats.get('total_errors', 0)}")
+        print(f"🐢 Throttled retries: {stats.get('throttled', 0)}")
         print(f"✅ Success rate: {stats.get('success_rate', 0)}%")
         print(f"⏱️  Total time: {stats.get('elapsed_time', 0):.2f}s")
         print(f"🚀 Speed: {stats.get('cards_per_second', 0):.2f} cards/sec")
@@ -264,7 +399,7 @@ async def main():
             except Exception as e:
                 print(f"⚠️ Could not generate summary: {e}")
         
-        print(f"\n💾 All data saved to: {scraper.config['output_folder']}/{scraper.config['output_file']}")
+        print(f"\n💾 All data saved to: {scraper.data_file}")
         print("✨ Smart scraping completed successfully!")
         
         # Determine exit code based on success
@@ -281,12 +416,9 @@ async def main():
         print("💾 Any completed pages have been saved")
         print("🔄 Use --resume flag to continue from where you left off")
         
-        # Ensure proper cleanup
-        try:
-            if 'scraper' in locals():
-                await scraper._cleanup_browser()
-        except:
-            pass
+        # Flush buffered pages and ensure proper cleanup
+        if 'scraper' in locals():
+            await shutdown_scraper(scraper)
         
         # Exit cleanly for user interruption
         return  # Don't use sys.exit() for user interruption
@@ -295,12 +427,9 @@ async def main():
         print(f"\n❌ Critical Error: {e}")
         print("💡 Check the logs for more details")
         
-        # Try to cleanup browser even on error
-        try:
-            if 'scraper' in locals():
-                await scraper._cleanup_browser()
-        except:
-            pass
+        # Flush and cleanup browser even on error
+        if 'scraper' in locals():
+            await shutdown_scraper(scraper)
         
         # Check if we have successfully scraped some data
         if 'scraper' in locals() and hasattr(scraper, 'all_cards') and scraper.all_cards:
@@ -314,11 +443,12 @@ async def main():
 
 
 if __name__ == "__main__":
-    # Suppress warnings before running
+    # Suppress warnings and pick the event loop before running
     suppress_asyncio_warnings()
+    setup_event_loop_policy()
     
     try:
-        asyncio.run(main())
+        asyncio.run(main(), debug=False)
         # If we reach here, everything completed successfully
         sys.exit(0)
     except KeyboardInterrupt:
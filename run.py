@@ -10,22 +10,22 @@ for the GitHub Actions workflow, avoiding Python-in-YAML issues.
 import json
 import sys
 import os
-from pathlib import Path
+from config import DATA_FILE, OUTPUT_DIR, SCRAPING_CONFIG
 
 
 def verify_output_files():
     """Verify output files and generate GitHub Actions outputs."""
     
     # Check if required files exist
-    data_file = Path("output/data.json")
-    process_file = Path("output/process.json")
+    data_file = DATA_FILE
+    process_file = OUTPUT_DIR / SCRAPING_CONFIG["resume_file"]
     
     if not data_file.exists() or not process_file.exists():
         print("❌ Required output files missing")
         if data_file.exists():
-            print("✅ data.json exists")
+            print(f"✅ {data_file.name} exists")
         else:
-            print("❌ data.json missing")
+            print(f"❌ {data_file.name} missing")
             
         if process_file.exists():
             print("✅ process.json exists")
@@ -33,22 +33,23 @@ def verify_output_files():
             print("❌ process.json missing")
             
         # List what's actually in output directory
-        output_dir = Path("output")
-        if output_dir.exists():
-            print(f"📁 Contents of output/:")
-            for file in output_dir.iterdir():
+        if OUTPUT_DIR.exists():
+            print(f"📁 Contents of {OUTPUT_DIR}/:")
+            for file in OUTPUT_DIR.iterdir():
                 print(f"   - {file.name}")
         else:
-            print("📁 output/ directory doesn't exist")
+            print(f"📁 {OUTPUT_DIR}/ directory doesn't exist")
             
         return False
     
     try:
-        # Read data.json
-        with open(data_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        card_count = data.get('total', 0)
+        if SCRAPING_CONFIG["output_format"] == "jsonl":
+            # Count data.jsonl records (one card per line) without parsing them
+            with open(data_file, 'rb') as f:
+                card_count = sum(1 for _ in f)
+        else:
+            with open(data_file, 'r', encoding='utf-8') as f:
+                card_count = len(json.load(f).get('cards', []))
         
         # Read process.json
         with open(process_file, 'r', encoding='utf-8') as f:
@@ -72,7 +73,7 @@ def verify_output_files():
         
         # Verify data consistency
         if card_count != total_cards_in_process:
-            print(f"⚠️ Warning: Card count mismatch (data.json: {card_count}, process.json: {total_cards_in_process})")
+            print(f"⚠️ Warning: Card count mismatch ({data_file.name}: {card_count}, process.json: {total_cards_in_process})")
         
         return True
         
@@ -87,7 +88,7 @@ def verify_output_files():
 def get_progress_info():
     """Get progress information from process.json."""
     
-    process_file = Path("output/process.json")
+    process_file = OUTPUT_DIR / SCRAPING_CONFIG["resume_file"]
     
     if not process_file.exists():
         print("📊 No progress file found - starting fresh")
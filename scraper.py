@@ -18,29 +18,166 @@ Author: Senior Developer
 Version: 1.0.0-advanced
 """
 
+from __future__ import annotations
+
 import asyncio
 import json
 import logging
 import re
+import sqlite3
 import time
 import sys
 import signal
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Set
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Any, Set
 from urllib.parse import urljoin
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from logging.handlers import RotatingFileHandler
 
-from playwright.async_api import async_playwright, Page, Browser, BrowserContext, TimeoutError
+# Playwright is imported lazily in the browser code paths so --summary stays fast
+if TYPE_CHECKING:
+    from playwright.async_api import Page, Browser, BrowserContext
+
+try:
+    import orjson  # Optional fast JSON backend
+except ImportError:
+    orjson = None
 
 # Import configuration
 from config import (
     SCRAPING_CONFIG, BROWSER_CONFIG, URLS, DATA_CONFIG, LOGGING_CONFIG,
-    SELECTORS, ERROR_CONFIG, PERFORMANCE_CONFIG, OUTPUT_DIR, SCRAPER_VERSION,
-    WAIT_SELECTORS
+    SELECTORS, ERROR_CONFIG, PERFORMANCE_CONFIG, OUTPUT_DIR, DATA_FILE,
+    SCRAPER_VERSION, WAIT_SELECTORS
 )
 
 
+def _json_dumps(data: Any, pretty: bool = False) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(data, ensure_ascii=False, indent=2 if pretty else None).encode('utf-8')
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class PageCache:
+    """
+    Small SQLite-backed cache of scraped results keyed by URL.
+    
+    Lets resumed runs and reruns skip browser navigation for listing pages
+    and card pages that were already extracted within the TTL.
+    """
+    
+    def __init__(self, path: Path, ttl: Optional[float] = None):
+        """Open (or create) the cache database."""
+        self.path = path
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "url TEXT PRIMARY KEY, stored_at REAL NOT NULL, data BLOB NOT NULL)"
+        )
+        self._conn.commit()
+        
+        # Drop expired rows so the file does not keep a stale copy of every card forever
+        if ttl is not None:
+            expired = self._conn.execute(
+                "DELETE FROM entries WHERE stored_at < ?", (time.time() - ttl,)
+            ).rowcount
+            self._conn.commit()
+            if expired:
+                self._conn.execute("VACUUM")
+    
+    def get(self, url: str) -> Optional[Any]:
+        """Return the cached value for url, or None if missing or expired."""
+        row = self._conn.execute(
+            "SELECT stored_at, data FROM entries WHERE url = ?", (url,)
+        ).fetchone()
+        
+        if row is None or (self.ttl is not None and time.time() - row[0] > self.ttl):
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        return _json_loads(row[1])
+    
+    def set(self, url: str, value: Any) -> None:
+        """Store value for url, replacing any previous entry."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO entries (url, stored_at, data) VALUES (?, ?, ?)",
+            (url, time.time(), _json_dumps(value))
+        )
+        self._conn.commit()
+    
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+
+class ThrottledError(RuntimeError):
+    """Raised on 429 (or 503 with Retry-After); carries how long to wait before retrying."""
+    
+    def __init__(self, status: int, retry_after: float):
+        super().__init__(f"Server responded with HTTP {status}, retrying in {retry_after:.1f}s")
+        self.status = status
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """
+    Concurrency limiter whose limit can be changed while tasks are waiting.
+    
+    An asyncio.Semaphore cannot be safely resized; here acquire() simply waits
+    on a condition until fewer than `limit` holders are active, so lowering
+    the limit takes effect as holders release and raising it wakes waiters.
+    """
+    
+    def __init__(self, limit: int):
+        """Create a controller admitting up to `limit` concurrent holders."""
+        self.limit = limit
+        self.active = 0
+        self._condition = asyncio.Condition(asyncio.Lock())
+    
+    async def acquire(self) -> None:
+        """Wait until a slot is free under the current limit, then take it."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.active < self.limit)
+            self.active += 1
+    
+    async def release(self) -> None:
+        """Give a slot back and wake one waiter."""
+        async with self._condition:
+            self.active -= 1
+            self._condition.notify(1)
+    
+    async def set_limit(self, limit: int) -> None:
+        """Change the limit and let all waiters re-check it."""
+        async with self._condition:
+            self.limit = limit
+            self._condition.notify_all()
+    
+    async def __aenter__(self) -> "AdmissionController":
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.release()
+
+
 class AdvancedShoobCardScraper:
     """
     Advanced event-driven web scraper for Shoob.gg cards.
@@ -53,7 +190,25 @@ class AdvancedShoobCardScraper:
     - Performance tracking with wait time analytics
     """
     
-    def __init__(self):
+    # Precompiled extraction patterns (compiled once, shared by every card)
+    CARD_ID_PATTERN = re.compile(r'/cards/info/([a-f0-9]+)')
+    SERIES_PATTERN = re.compile(r'from\s+([^\n\\]+?)(?:\n|\\n|Creators:|$)')
+    SERIES_CREATORS_SUFFIX = re.compile(r'\s*Creators:.*')
+    SERIES_MAKER_SUFFIX = re.compile(r'\s*-\s*Card Maker:.*')
+    CREATOR_PATTERNS = [
+        re.compile(r'Card Maker:\s*([^\n\\]+)', re.IGNORECASE),
+        re.compile(r'Creators:\s*-\s*Card Maker:\s*([^\n\\]+)', re.IGNORECASE),
+        re.compile(r'- Card Maker:\s*([^\n\\]+)', re.IGNORECASE),
+    ]
+    HTML_ENTITY_PATTERN = re.compile(r'&[^;]+;')
+    ESCAPED_NEWLINE_TAIL = re.compile(r'\\n.*')
+    TIER_IN_URL_PATTERN = re.compile(r'/cards/([0-9S])/', re.IGNORECASE)
+    TIER_IN_TEXT_PATTERN = re.compile(r'tier[:\s]*([0-9S]+)', re.IGNORECASE)
+    WHITESPACE_PATTERN = re.compile(r'\s+')
+    CONTROL_WHITESPACE_PATTERN = re.compile(r'[\r\n\t]')
+    ESCAPED_NEWLINE_PATTERN = re.compile(r'\\n')
+    
+    def __init__(self, verbose: bool = False):
         """Initialize the advanced scraper with smart waiting."""
         self.config = SCRAPING_CONFIG
         self.browser_config = BROWSER_CONFIG
@@ -66,14 +221,43 @@ class AdvancedShoobCardScraper:
         self.all_cards: List[Dict[str, Any]] = []
         self.scraped_pages: Set[int] = set()
         self.failed_card_ids: Set[str] = set()  # Track failed cards for retry
+        self._pending_pages: List[int] = []  # Completed pages not yet written to disk
+        self._stop_producing = False  # Set when workers should stop taking new pages
+        self._empty_listing_pages: Set[int] = set()  # Listings that loaded with no cards (auto-detect end)
+        self._shutdown_event: Optional[asyncio.Event] = None  # Set externally on SIGINT/SIGTERM
+        
+        # Adaptive limit on concurrent navigations (backs off on 429/5xx)
+        self.admission = AdmissionController(self.config["max_concurrency"])
+        self._success_streak = 0
+        
+        # URL result cache (opened when scraping starts)
+        self.cache: Optional[PageCache] = None
+        
+        # Append-only JSONL output state
+        self.data_file = DATA_FILE
+        self._out_fp = None
+        self._saved_card_count = 0  # Cards in all_cards already written to disk
+        self._cards_on_disk = 0
+        self._sample_cards: List[Dict[str, Any]] = []  # First cards on disk, for the summary preview
+        self._output_scanned = False  # True once the counters above reflect the data file
+        self._json_history: Optional[List[Dict[str, Any]]] = None  # Cards from earlier sessions (json format)
+        
+        # Append-only resume cursor (one completed page number per line)
+        self._cursor_fp = None
+        self._cursor_pages: Set[int] = set()  # Pages already recorded in the cursor file
         self.session_id = f"advanced_session_{int(time.time())}"
         
         # Browser cleanup tracking
+        self.playwright = None
         self.browser = None
         self.context = None
         self.page = None
         self.cleanup_done = False
         
+        # Reusable worker tabs (created once, shared across all pages)
+        self._page_pool: Optional[asyncio.Queue] = None
+        self._pool_pages: List[Page] = []
+        
         # Performance tracking
         self.wait_times = {
             "page_loads": [],
@@ -83,16 +267,18 @@ class AdvancedShoobCardScraper:
         }
         
         # Setup logging
-        self._setup_logging()
+        self._setup_logging(verbose)
         
         # Initialize statistics
         self.stats = {
             "start_time": None,
             "pages_scraped": 0,
             "cards_extracted": 0,
+            "cards_from_cache": 0,  # Subset of cards_extracted served without navigating
             "pages_skipped": 0,
             "errors": 0,
             "consecutive_errors": 0,
+            "throttled": 0,
             "total_requests": 0,
             "success_rate": 0.0,
             "total_wait_time": 0.0,
@@ -107,17 +293,19 @@ class AdvancedShoobCardScraper:
         self.logger.info(f"⚡ Smart waiting enabled - no fixed delays!")
         self.logger.info(f"📁 Output directory: {OUTPUT_DIR}")
         
-    def _setup_logging(self) -> None:
+    def _setup_logging(self, verbose: bool = False) -> None:
         """Setup professional logging configuration with error file logging."""
+        level = logging.DEBUG if verbose else LOGGING_CONFIG["level"]
         self.logger = logging.getLogger(__name__)
-        self.logger.setLevel(LOGGING_CONFIG["level"])
+        self.logger.setLevel(level)
         
         # Clear existing handlers
         self.logger.handlers.clear()
         
-        # Console handler (clean output)
+        # Console handler (clean output; per-page detail is DEBUG, shown with --verbose)
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(LOGGING_CONFIG["level"])
+        console_handler.setLevel(level)
+        self._console_handler = console_handler
         
         # Create formatter
         formatter = logging.Formatter(
@@ -160,6 +348,10 @@ class AdvancedShoobCardScraper:
         # Prevent propagation to root logger
         self.logger.propagate = False
     
+    def set_log_stream(self, stream) -> None:
+        """Redirect console logging, e.g. to a progress display's stdout proxy."""
+        self._console_handler.setStream(stream)
+    
     def _log_to_file_only(self, message: str, level: str = "WARNING") -> None:
         """Log message to file only, not console, to keep progress display clean."""
         if hasattr(self, '_file_logger'):
@@ -171,15 +363,34 @@ class AdvancedShoobCardScraper:
                 self._file_logger.warning(message)
     
     def _load_progress(self) -> Dict[str, Any]:
-        """Load scraping progress from file."""
+        """Load scraping progress from the page cursor, falling back to process.json."""
         progress_file = OUTPUT_DIR / self.config["resume_file"]
+        cursor_file = OUTPUT_DIR / self.config["cursor_file"]
         
-        if not progress_file.exists() or not self.config["enable_resume"]:
+        if not self.config["enable_resume"]:
+            return {"scraped_pages": [], "total_cards": 0}
+        
+        # The append-only cursor holds one completed page number per line
+        if cursor_file.exists():
+            try:
+                with open(cursor_file, 'r', encoding='utf-8') as f:
+                    self.scraped_pages = {int(line) for line in f if line.strip()}
+                self._cursor_pages = set(self.scraped_pages)
+                
+                if self.scraped_pages:
+                    self.logger.info(f"📂 Resume: Found {len(self.scraped_pages)} previously scraped pages")
+                
+                return {"scraped_pages": sorted(self.scraped_pages)}
+                
+            except Exception as e:
+                self._log_to_file_only(f"Could not load page cursor, using progress file: {e}")
+        
+        if not progress_file.exists():
             return {"scraped_pages": [], "total_cards": 0}
         
         try:
-            with open(progress_file, 'r', encoding='utf-8') as f:
-                progress = json.load(f)
+            with open(progress_file, 'rb') as f:
+                progress = _json_loads(f.read())
             
             self.scraped_pages = set(progress.get("scraped_pages", []))
             if self.scraped_pages:
@@ -191,54 +402,54 @@ class AdvancedShoobCardScraper:
             self._log_to_file_only(f"Could not load progress file: {e}")
             return {"scraped_pages": [], "total_cards": 0}
     
-    def _save_progress(self) -> None:
-        """Save current scraping progress."""
-        if not self.config["enable_resume"]:
-            return
-            
-        progress_file = OUTPUT_DIR / self.config["resume_file"]
+    def _save_after_page(self, page_num: int, cards_count: int) -> None:
+        """Record a completed page and flush to disk once a full batch is pending."""
+        self._pending_pages.append(page_num)
+        self.logger.debug(f"✅ Page {page_num} completed ({cards_count} cards) - Total: {len(self.all_cards)} cards")
         
-        try:
-            progress_data = {
-                "session_id": self.session_id,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "scraped_pages": sorted(list(self.scraped_pages)),
-                "total_cards": len(self.all_cards),
-                "stats": self.stats,
-                "wait_times": self.wait_times
-            }
-            
-            with open(progress_file, 'w', encoding='utf-8') as f:
-                json.dump(progress_data, f, indent=2)
-                
-        except Exception as e:
-            self._log_to_file_only(f"Could not save progress: {e}")
+        # Live-save in batches instead of rewriting the output after every page
+        if self.config.get("live_save", True) and len(self._pending_pages) >= self.config["flush_interval"]:
+            self._flush_to_disk()
     
-    def _save_after_page(self, page_num: int, cards_count: int) -> None:
-        """Save all data after each page."""
+    def flush(self) -> None:
+        """Persist all buffered pages and close the output files (safe to call repeatedly)."""
+        self._flush_to_disk()
+        self._close_output()
+    
+    def _flush_to_disk(self) -> None:
+        """Write data and progress for all pending pages in a single save."""
+        if not self._pending_pages:
+            return
+        
         try:
-            # Save progress tracking
-            self._save_progress()
-            
-            # Save complete data file if live-save is enabled
-            if self.config.get("live_save", True):
-                output_file = self._save_final_output()
-                self.logger.info(f"💾 Live-save: Page {page_num} completed ({cards_count} cards) - Total: {len(self.all_cards)} cards")
-            else:
-                self.logger.info(f"✅ Page {page_num} completed ({cards_count} cards) - Total: {len(self.all_cards)} cards")
+            self._save_final_output()
+            self.logger.info(f"💾 Live-save: Flushed {len(self._pending_pages)} pages - Total: {len(self.all_cards)} cards")
+            self._pending_pages.clear()
             
         except Exception as e:
-            self._log_to_file_only(f"Could not save after page {page_num}: {e}")
+            self._log_to_file_only(f"Could not flush pages {self._pending_pages}: {e}")
     
     async def _setup_browser(self) -> tuple[Browser, BrowserContext, Page]:
         """Setup browser with professional anti-detection measures."""
         self.logger.info("🔧 Setting up advanced browser with smart waiting")
         
+        from playwright.async_api import async_playwright
+        
         playwright = await async_playwright().start()
+        self.playwright = playwright
         
+        # Skip downloading images and video the extraction never reads
+        launch_args = list(self.browser_config["browser_args"])
+        if self.browser_config["block_media"]:
+            launch_args += self.browser_config["media_blocking_args"]
+        
+        # Leave SIGINT/SIGTERM to our own shutdown handling so the browser stays
+        # up while in-flight pages finish
         browser = await playwright.chromium.launch(
             headless=self.browser_config["headless"],
-            args=self.browser_config["browser_args"]
+            args=launch_args,
+            handle_sigint=False,
+            handle_sigterm=False
         )
         
         context = await browser.new_context(
@@ -273,13 +484,45 @@ class AdvancedShoobCardScraper:
             });
         """)
         
-        page = await context.new_page()
+        # Set additional headers on the context so every worker page shares them
+        await context.set_extra_http_headers(self.browser_config["extra_headers"])
         
-        # Set additional headers
-        await page.set_extra_http_headers(self.browser_config["extra_headers"])
+        page = await context.new_page()
         
         return browser, context, page
     
+    async def _warmup(self) -> None:
+        """Prime DNS and open a TLS connection to shoob.gg before the workers start."""
+        start_time = time.time()
+        
+        try:
+            # Tabs share the context's resolver cache and socket pool, so one
+            # navigation that stops at the first response byte warms them all
+            await self.page.goto(self.urls["base_url"], wait_until="commit", timeout=self.config["page_load_timeout"])
+            self.logger.debug(f"🔥 Connection warm-up took {time.time() - start_time:.2f}s")
+        except Exception as e:
+            self._log_to_file_only(f"Connection warm-up failed: {e}")
+    
+    async def _ensure_page_pool(self) -> asyncio.Queue:
+        """Create the pool of reusable worker tabs on first use."""
+        if self._page_pool is None:
+            self._page_pool = asyncio.Queue()
+            for _ in range(self.config["max_concurrency"]):
+                page = await self.context.new_page()
+                self._pool_pages.append(page)
+                self._page_pool.put_nowait(page)
+        
+        return self._page_pool
+    
+    async def _release_page(self, page: Page) -> None:
+        """Return a worker tab to the pool, replacing it if it was closed or crashed."""
+        if page.is_closed():
+            self._pool_pages.remove(page)
+            page = await self.context.new_page()
+            self._pool_pages.append(page)
+        
+        self._page_pool.put_nowait(page)
+    
     async def _cleanup_browser(self):
         """Safely cleanup browser resources."""
         if self.cleanup_done:
@@ -288,7 +531,15 @@ class AdvancedShoobCardScraper:
         self.cleanup_done = True
         
         try:
-            # Close page first
+            # Close pooled worker tabs first
+            for page in self._pool_pages:
+                if not page.is_closed():
+                    await page.close()
+        except Exception:
+            pass
+        
+        try:
+            # Close page
             if self.page and not self.page.is_closed():
                 await self.page.close()
                 await asyncio.sleep(0.1)
@@ -311,6 +562,13 @@ class AdvancedShoobCardScraper:
         except Exception:
             pass
         
+        try:
+            # Stop the Playwright driver process
+            if self.playwright:
+                await self.playwright.stop()
+        except Exception:
+            pass
+        
         # Additional cleanup for Windows
         try:
             import sys
@@ -319,15 +577,17 @@ class AdvancedShoobCardScraper:
         except Exception:
             pass
     
-    async def _smart_wait_for_element(self, selector: str, timeout: int = None, description: str = "") -> bool:
+    async def _smart_wait_for_element(self, page: Page, selector: str, timeout: int = None, description: str = "") -> bool:
         """Smart wait for element with performance tracking."""
+        from playwright.async_api import TimeoutError
+        
         if timeout is None:
             timeout = self.config["max_wait_timeout"]
         
         start_time = time.time()
         
         try:
-            await self.page.wait_for_selector(selector, timeout=timeout)
+            await page.wait_for_selector(selector, timeout=timeout)
             wait_time = time.time() - start_time
             self.wait_times["element_waits"].append(wait_time)
             self.stats["total_wait_time"] += wait_time
@@ -345,10 +605,11 @@ class AdvancedShoobCardScraper:
             self._log_to_file_only(f"Error waiting for {selector}: {e}")
             return False
     
-    async def _smart_wait_for_cards_loaded(self) -> bool:
+    async def _smart_wait_for_cards_loaded(self, page: Page) -> bool:
         """Wait for cards to be loaded on the page with flexible detection."""
         # Strategy 1: Wait for at least one card link (quick check)
         if await self._smart_wait_for_element(
+            page,
             self.wait_selectors["cards_container"], 
             5000,  # Shorter timeout for first card
             "First card link"
@@ -358,7 +619,7 @@ class AdvancedShoobCardScraper:
             
             # Strategy 3: Check how many cards we have
             try:
-                card_count = await self.page.locator(self.wait_selectors["cards_container"]).count()
+                card_count = await page.locator(self.wait_selectors["cards_container"]).count()
                 
                 if card_count >= 5:
                     # We have a good number of cards, proceed
@@ -368,7 +629,7 @@ class AdvancedShoobCardScraper:
                     await asyncio.sleep(1.0)
                     
                     # Check again
-                    final_count = await self.page.locator(self.wait_selectors["cards_container"]).count()
+                    final_count = await page.locator(self.wait_selectors["cards_container"]).count()
                     return final_count > 0
                 else:
                     return False
@@ -378,10 +639,11 @@ class AdvancedShoobCardScraper:
         
         return False
     
-    async def _smart_wait_for_card_data(self) -> bool:
+    async def _smart_wait_for_card_data(self, page: Page) -> bool:
         """Wait for card data to be loaded on individual card page with flexible fallbacks."""
         # Strategy 1: Wait for any meta title (more flexible)
         meta_loaded = await self._smart_wait_for_element(
+            page,
             "meta[property='og:title'], title",
             5000,  # Shorter timeout for basic elements
             "Basic card title"
@@ -393,7 +655,7 @@ class AdvancedShoobCardScraper:
             
             # Strategy 3: Verify we have actual content (not just empty tags)
             try:
-                title_content = await self.page.evaluate("""
+                title_content = await page.evaluate("""
                     () => {
                         const ogTitle = document.querySelector('meta[property="og:title"]');
                         const pageTitle = document.querySelector('title');
@@ -420,6 +682,7 @@ class AdvancedShoobCardScraper:
         
         # Strategy 4: Fallback - wait for any page content
         content_loaded = await self._smart_wait_for_element(
+            page,
             "body, main, .container",
             3000,
             "Basic page content"
@@ -432,9 +695,23 @@ class AdvancedShoobCardScraper:
         # Strategy 5: Last resort - if we're here, the page might be loaded but slow
         return True  # Proceed anyway and let extraction handle what's available
     
-    async def _get_card_links_from_page(self, page_num: int) -> List[str]:
-        """Extract card links with smart waiting."""
+    async def _get_card_links_from_page(self, page: Page, page_num: int) -> Optional[List[str]]:
+        """
+        Extract card links with smart waiting.
+        
+        Returns an empty list only when the listing loaded without any cards,
+        and None when it could not be loaded after all attempts.
+        """
         url = f"{self.urls['base_url']}?page={page_num}"
+        empty_attempts = 0
+        
+        # Reuse card links from a previous run if still fresh
+        if self.cache is not None:
+            cached_links = self.cache.get(url)
+            if cached_links:
+                self.logger.debug(f"✅ Page {page_num}: Found {len(cached_links)} cards (cached)")
+                self.stats["consecutive_errors"] = 0
+                return cached_links
         
         for attempt in range(self.config["retry_attempts"]):
             try:
@@ -442,25 +719,31 @@ class AdvancedShoobCardScraper:
                 
                 # Navigate and wait for network to be idle
                 page_start_time = time.time()
-                await self.page.goto(url, wait_until="networkidle", timeout=self.config["page_load_timeout"])
+                async with self.admission:
+                    response = await page.goto(url, wait_until="networkidle", timeout=self.config["page_load_timeout"])
+                await self._adapt_concurrency(response)
                 
                 # Smart wait for cards to load
-                cards_loaded = await self._smart_wait_for_cards_loaded()
+                cards_loaded = await self._smart_wait_for_cards_loaded(page)
                 
                 if not cards_loaded:
                     self._log_to_file_only(f"Cards didn't load properly on page {page_num}")
+                    # The listing responded but rendered no card links
+                    if response is not None:
+                        empty_attempts += 1
                     continue
                 
                 page_load_time = time.time() - page_start_time
                 self.wait_times["page_loads"].append(page_load_time)
                 
-                # Extract card links immediately once loaded
+                # Extract card links immediately once loaded, one browser round-trip per selector
                 card_links = []
                 for selector in self.selectors["card_links"]:
-                    link_elements = await self.page.locator(selector).all()
+                    hrefs = await page.eval_on_selector_all(
+                        selector, "elements => elements.map(el => el.getAttribute('href'))"
+                    )
                     
-                    for link_element in link_elements:
-                        href = await link_element.get_attribute("href")
+                    for href in hrefs:
                         if href:
                             full_url = urljoin(self.urls["site_url"], href)
                             card_links.append(full_url)
@@ -469,8 +752,10 @@ class AdvancedShoobCardScraper:
                 unique_links = list(dict.fromkeys(card_links))
                 
                 if unique_links:
-                    self.logger.info(f"✅ Page {page_num}: Found {len(unique_links)} cards")
+                    self.logger.debug(f"✅ Page {page_num}: Found {len(unique_links)} cards")
                     self.stats["consecutive_errors"] = 0
+                    if self.cache is not None:
+                        self.cache.set(url, unique_links)
                     return unique_links
                 else:
                     self._log_to_file_only(f"Page {page_num}: No cards found")
@@ -478,28 +763,45 @@ class AdvancedShoobCardScraper:
                 
             except Exception as e:
                 self._log_to_file_only(f"Attempt {attempt + 1} failed for page {page_num}: {e}")
-                self.stats["errors"] += 1
-                self.stats["consecutive_errors"] += 1
+                delay = self._record_failure(e)
                 
                 if attempt < self.config["retry_attempts"] - 1:
-                    await asyncio.sleep(self.config["retry_delay"])
+                    await asyncio.sleep(delay)
                 else:
                     self._log_to_file_only(f"Failed to get cards from page {page_num} after all attempts", "ERROR")
-                    return []
+                    return None
+        
+        # Every attempt loaded the listing without finding cards, so the page is genuinely empty
+        if empty_attempts == self.config["retry_attempts"]:
+            self._log_to_file_only(f"Page {page_num}: No cards found")
+            return []
+        
+        return None
     
-    async def _extract_card_data(self, card_url: str, page_num: int = None) -> Optional[Dict[str, Any]]:
+    async def _extract_card_data(self, page: Page, card_url: str, page_num: int = None) -> Optional[Dict[str, Any]]:
         """Extract card data with smart waiting and robust error handling."""
-        card_id = re.search(r'/cards/info/([a-f0-9]+)', card_url)
+        card_id = self.CARD_ID_PATTERN.search(card_url)
         card_id = card_id.group(1) if card_id else "unknown"
         
+        # Reuse a previously extracted card if still fresh
+        if self.cache is not None:
+            cached_card = self.cache.get(card_url)
+            if cached_card:
+                cached_card["page_num"] = page_num if page_num is not None else cached_card.get("page_num")
+                self.stats["cards_extracted"] += 1
+                self.stats["cards_from_cache"] += 1
+                return cached_card
+        
         for attempt in range(self.config["retry_attempts"]):
             try:
                 # Navigate with smart waiting
                 card_start_time = time.time()
-                await self.page.goto(card_url, wait_until="domcontentloaded", timeout=self.config["page_load_timeout"])
+                async with self.admission:
+                    response = await page.goto(card_url, wait_until="domcontentloaded", timeout=self.config["page_load_timeout"])
+                await self._adapt_concurrency(response)
                 
                 # Smart wait for card data to be loaded (more flexible now)
-                data_loaded = await self._smart_wait_for_card_data()
+                data_loaded = await self._smart_wait_for_card_data(page)
                 
                 if not data_loaded:
                     self._log_to_file_only(f"Card data didn't load properly for {card_id}, but proceeding with extraction")
@@ -508,7 +810,7 @@ class AdvancedShoobCardScraper:
                 self.wait_times["card_loads"].append(card_load_time)
                 
                 # Extract meta tags immediately once loaded (or after timeout)
-                meta_data = await self._extract_meta_tags()
+                meta_data = await self._extract_meta_tags(page)
                 
                 # Initialize card data (without load_time)
                 card_data = {
@@ -545,6 +847,8 @@ class AdvancedShoobCardScraper:
                 if card_data.get("card_id") and (card_data.get("name") or card_data.get("image_url")):
                     self.stats["cards_extracted"] += 1
                     self.stats["consecutive_errors"] = 0
+                    if self.cache is not None:
+                        self.cache.set(card_url, card_data)
                     return card_data
                 else:
                     # Still return the card data even if validation fails
@@ -554,20 +858,71 @@ class AdvancedShoobCardScraper:
                     
             except Exception as e:
                 self._log_to_file_only(f"Attempt {attempt + 1} failed for card {card_id}: {e}")
-                self.stats["errors"] += 1
-                self.stats["consecutive_errors"] += 1
+                delay = self._record_failure(e)
                 
                 if attempt < self.config["retry_attempts"] - 1:
-                    await asyncio.sleep(self.config["retry_delay"])
+                    await asyncio.sleep(delay)
                 else:
                     self._log_to_file_only(f"Failed to extract card {card_id} after all attempts", "ERROR")
                     self.failed_card_ids.add(card_id)  # Track failed card for potential retry
                     return None
     
-    async def _extract_meta_tags(self) -> Dict[str, str]:
+    def _record_failure(self, error: Exception) -> float:
+        """Count a failed attempt and return how long to wait before the next one."""
+        # Throttling is the server pacing us, not a broken page: keep it out of the
+        # consecutive-error budget so a burst of 429s cannot abort the run
+        if isinstance(error, ThrottledError):
+            self.stats["throttled"] += 1
+            return error.retry_after
+        
+        self.stats["errors"] += 1
+        self.stats["consecutive_errors"] += 1
+        return self.config["retry_delay"]
+    
+    def _retry_after_seconds(self, response) -> float:
+        """Delay requested by a Retry-After header (seconds or HTTP date), capped and with a default."""
+        value = response.headers.get("retry-after") if response is not None else None
+        delay = self.config["throttle_delay"]
+        
+        if value:
+            try:
+                delay = float(value)
+            except ValueError:
+                try:
+                    delay = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+                except (TypeError, ValueError):
+                    pass
+        
+        return min(max(delay, 0.0), self.config["max_throttle_delay"])
+    
+    async def _adapt_concurrency(self, response) -> None:
+        """Halve the navigation limit on 429/5xx responses and ramp it back up slowly on success."""
+        status = response.status if response is not None else 200
+        
+        if status == 429 or status >= 500:
+            self._success_streak = 0
+            new_limit = max(1, self.admission.limit // 2)
+            if new_limit != self.admission.limit:
+                await self.admission.set_limit(new_limit)
+                self._log_to_file_only(f"HTTP {status}: lowering concurrency limit to {new_limit}")
+            
+            # Only explicit rate limiting is waited out; other server errors count as
+            # failures so a persistently broken site still trips max_consecutive_errors
+            if status == 429 or (status == 503 and response.headers.get("retry-after")):
+                raise ThrottledError(status, self._retry_after_seconds(response))
+            raise RuntimeError(f"Server responded with HTTP {status}")
+        
+        self._success_streak += 1
+        if (self._success_streak >= self.config["ramp_up_after"]
+                and self.admission.limit < self.config["max_concurrency"]):
+            self._success_streak = 0
+            await self.admission.set_limit(self.admission.limit + 1)
+            self.logger.debug(f"📈 Raising concurrency limit to {self.admission.limit}")
+    
+    async def _extract_meta_tags(self, page: Page) -> Dict[str, str]:
         """Extract meta tags efficiently using JavaScript evaluation."""
         try:
-            meta_data = await self.page.evaluate("""
+            meta_data = await page.evaluate("""
                 () => {
                     const meta = {};
                     
@@ -614,11 +969,11 @@ class AdvancedShoobCardScraper:
         """Fast character source extraction using meta tags only."""
         description = meta_data.get("meta_name_description", "")
         if description:
-            from_match = re.search(r'from\s+([^\n\\]+?)(?:\n|\\n|Creators:|$)', description)
+            from_match = self.SERIES_PATTERN.search(description)
             if from_match:
                 series = from_match.group(1).strip()
-                series = re.sub(r'\s*Creators:.*', '', series)
-                series = re.sub(r'\s*-\s*Card Maker:.*', '', series)
+                series = self.SERIES_CREATORS_SUFFIX.sub('', series)
+                series = self.SERIES_MAKER_SUFFIX.sub('', series)
                 return self._clean_text(series)
         
         return "Unknown Series"
@@ -627,18 +982,12 @@ class AdvancedShoobCardScraper:
         """Fast creator extraction using meta tags only."""
         description = meta_data.get("meta_name_description", "")
         if description:
-            creator_patterns = [
-                r'Card Maker:\s*([^\n\\]+)',
-                r'Creators:\s*-\s*Card Maker:\s*([^\n\\]+)',
-                r'- Card Maker:\s*([^\n\\]+)'
-            ]
-            
-            for pattern in creator_patterns:
-                match = re.search(pattern, description, re.IGNORECASE)
+            for pattern in self.CREATOR_PATTERNS:
+                match = pattern.search(description)
                 if match:
                     creator = match.group(1).strip()
-                    creator = re.sub(r'&[^;]+;', '', creator)
-                    creator = re.sub(r'\\n.*', '', creator)
+                    creator = self.HTML_ENTITY_PATTERN.sub('', creator)
+                    creator = self.ESCAPED_NEWLINE_TAIL.sub('', creator)
                     return self._clean_text(creator)
         
         return ""
@@ -661,7 +1010,7 @@ class AdvancedShoobCardScraper:
         # Strategy 1: Extract from image URL (fastest and most reliable)
         og_image = meta_data.get("meta_property_og:image", "")
         if og_image:
-            tier_in_url = re.search(r'/cards/([0-9S])/', og_image, re.IGNORECASE)
+            tier_in_url = self.TIER_IN_URL_PATTERN.search(og_image)
             if tier_in_url:
                 tier = tier_in_url.group(1)
                 if tier in ['1', '2', '3', '4', '5', 'S', 's']:
@@ -670,7 +1019,7 @@ class AdvancedShoobCardScraper:
         # Strategy 2: Meta tags (fallback)
         for meta_text in [meta_data.get("meta_property_og:title", ""), meta_data.get("page_title", "")]:
             if meta_text:
-                tier_match = re.search(r'tier[:\s]*([0-9S]+)', meta_text, re.IGNORECASE)
+                tier_match = self.TIER_IN_TEXT_PATTERN.search(meta_text)
                 if tier_match and tier_match.group(1) in ['1', '2', '3', '4', '5', 'S', 's']:
                     return tier_match.group(1).upper() if tier_match.group(1).lower() == 's' else tier_match.group(1)
         
@@ -715,40 +1064,43 @@ class AdvancedShoobCardScraper:
         
         # Remove extra whitespace and newlines
         if self.data_config["remove_extra_whitespace"]:
-            cleaned = re.sub(r'\s+', ' ', text.strip())
-            cleaned = re.sub(r'[\r\n\t]', ' ', cleaned)
-            cleaned = re.sub(r'\\n', ' ', cleaned)
+            cleaned = self.WHITESPACE_PATTERN.sub(' ', text.strip())
+            cleaned = self.CONTROL_WHITESPACE_PATTERN.sub(' ', cleaned)
+            cleaned = self.ESCAPED_NEWLINE_PATTERN.sub(' ', cleaned)
             cleaned = cleaned.strip()
         else:
             cleaned = text.strip()
         
         return cleaned
     
-    async def _scrape_page(self, page_num: int) -> List[Dict[str, Any]]:
+    async def _scrape_page(self, page: Page, page_num: int) -> List[Dict[str, Any]]:
         """Scrape all cards from a single page with professional progress indicators."""
         
         try:
             # Get card links from the page (with smart waiting)
-            card_links = await self._get_card_links_from_page(page_num)
+            card_links = await self._get_card_links_from_page(page, page_num)
+            
+            if card_links is None:
+                self._log_to_file_only(f"Could not load listing for page {page_num}", "ERROR")
+                return []
             
             if not card_links:
                 self._log_to_file_only(f"No cards found on page {page_num}")
+                self._empty_listing_pages.add(page_num)
                 return []
             
-            # Extract data from each card with clean progress indicator
+            # Extract data from each card
             page_cards = []
+            failed_cards = 0
             total_cards = len(card_links)
             
             for i, card_url in enumerate(card_links, 1):
                 try:
-                    # Clean progress indicator that updates in place - write to stderr to avoid logger capture
-                    progress_text = f"🔄 Processing cards: [{i}/{total_cards}] ({i/total_cards*100:.0f}%)"
-                    sys.stderr.write(f"\r{progress_text:<60}")
-                    sys.stderr.flush()
-                    
-                    card_data = await self._extract_card_data(card_url, page_num)
+                    card_data = await self._extract_card_data(page, card_url, page_num)
                     if card_data:
                         page_cards.append(card_data)
+                    else:
+                        failed_cards += 1
                     
                     # Minimal delay only if needed for rate limiting
                     if i < total_cards:
@@ -758,12 +1110,16 @@ class AdvancedShoobCardScraper:
                     # Log errors to file only to keep console clean
                     self._log_to_file_only(f"Error processing card {i}/{total_cards}: {e}", "ERROR")
                     self.stats["errors"] += 1
+                    failed_cards += 1
                     continue
             
-            # Clear progress line and show final result
-            final_text = f"✅ Page {page_num}: Extracted {len(page_cards)}/{total_cards} cards"
-            sys.stderr.write(f"\r{final_text:<60}\n")
-            sys.stderr.flush()
+            # Cards that failed during shutdown will not be retried, so leave the page
+            # unsaved for --resume instead of recording it as complete
+            if failed_cards and self._shutdown_event is not None and self._shutdown_event.is_set():
+                self._log_to_file_only(f"Page {page_num}: {failed_cards} cards failed during shutdown, not marking it complete")
+                return []
+            
+            self.logger.debug(f"✅ Page {page_num}: Extracted {len(page_cards)}/{total_cards} cards")
             self.stats["pages_scraped"] += 1
             
             # Add cards to main collection
@@ -780,11 +1136,97 @@ class AdvancedShoobCardScraper:
             self.stats["errors"] += 1
             return []
     
+    def _should_stop(self) -> bool:
+        """Whether workers should stop taking new pages."""
+        return self._stop_producing or (self._shutdown_event is not None and self._shutdown_event.is_set())
+    
+    async def _produce_pages(self, queue: asyncio.Queue, start_page: int, end_page: Optional[int], worker_count: int) -> None:
+        """Enqueue page numbers for the workers, then one stop sentinel per worker."""
+        consecutive_error_limit = ERROR_CONFIG["max_consecutive_errors"]
+        page_num = start_page
+        
+        while end_page is None or page_num <= end_page:
+            # Auto-detect reached the end, a worker hit a fatal error, or shutdown was requested
+            if self._should_stop():
+                break
+            
+            # Check consecutive error limit
+            if self.stats["consecutive_errors"] >= consecutive_error_limit:
+                self.logger.error(f"❌ Too many consecutive errors ({consecutive_error_limit}), stopping")
+                break
+            
+            if page_num in self.scraped_pages:
+                self.stats["pages_skipped"] += 1
+            else:
+                await queue.put(page_num)
+            page_num += 1
+        
+        for _ in range(worker_count):
+            await queue.put(None)
+    
+    async def _page_worker(
+        self,
+        queue: asyncio.Queue,
+        total_pages: Optional[int],
+        on_page_done: Optional[Callable[[int, Optional[int]], None]] = None
+    ) -> None:
+        """Scrape queued pages in pooled browser tabs until a stop sentinel arrives."""
+        while True:
+            page_num = await queue.get()
+            if page_num is None:
+                return
+            
+            # Drain pages queued before the producer was told to stop
+            if self._should_stop():
+                continue
+            
+            page = await self._page_pool.get()
+            try:
+                # Log which page we're scraping
+                self.logger.debug(f"🚀 Scraping page {page_num}")
+                
+                # Scrape the page with smart waiting in a reused worker tab
+                await self._scrape_page(page, page_num)
+                
+                # In auto-detect mode a listing that loaded without cards marks the end;
+                # pages that merely failed do not
+                if total_pages is None and page_num in self._empty_listing_pages and not self._stop_producing:
+                    self.logger.info(f"📭 Page {page_num} has no cards, stopping auto-detect")
+                    self._stop_producing = True
+                
+                # Progress update
+                if LOGGING_CONFIG["show_progress"]:
+                    if total_pages:
+                        progress = (self.stats["pages_scraped"] / total_pages) * 100
+                        self.logger.debug(f"📈 Progress: {progress:.1f}% ({self.stats['pages_scraped']}/{total_pages} pages)")
+                    else:
+                        self.logger.debug(f"📈 Progress: {self.stats['pages_scraped']} pages")
+                
+                # Minimal delay between pages (only for rate limiting)
+                await asyncio.sleep(self.config["minimal_delay"])
+                
+            except Exception as e:
+                self._log_to_file_only(f"Critical error processing page {page_num}: {e}", "ERROR")
+                self.stats["errors"] += 1
+                self.stats["consecutive_errors"] += 1
+                
+                if ERROR_CONFIG["continue_on_error"]:
+                    await asyncio.sleep(ERROR_CONFIG["error_cooldown"])
+                else:
+                    self._stop_producing = True
+                    
+            finally:
+                await self._release_page(page)
+                if on_page_done is not None:
+                    on_page_done(page_num, total_pages)
+    
     def _calculate_statistics(self) -> Dict[str, Any]:
         """Calculate comprehensive scraping statistics with wait time analytics."""
         if self.stats["start_time"]:
             elapsed_time = time.time() - self.stats["start_time"]
-            cards_per_second = self.stats["cards_extracted"] / elapsed_time if elapsed_time > 0 else 0
+            # Cache hits cost no navigation, so they would inflate the extraction speed
+            fetched_cards = self.stats["cards_extracted"] - self.stats["cards_from_cache"]
+            cards_per_second = fetched_cards / elapsed_time if elapsed_time > 0 else 0
             pages_per_minute = (self.stats["pages_scraped"] / elapsed_time) * 60 if elapsed_time > 0 else 0
         else:
             elapsed_time = 0
@@ -805,11 +1247,14 @@ class AdvancedShoobCardScraper:
             "pages_skipped": self.stats["pages_skipped"],
             "cards_extracted": self.stats["cards_extracted"],
             "total_errors": self.stats["errors"],
+            "throttled": self.stats["throttled"],
             "success_rate": round(success_rate, 2),
             "elapsed_time": round(elapsed_time, 2),
             "cards_per_second": round(cards_per_second, 2),
             "pages_per_minute": round(pages_per_minute, 2),
             "average_cards_per_page": round(self.stats["cards_extracted"] / max(self.stats["pages_scraped"], 1), 1),
+            "cache_hits": self.cache.hits if self.cache is not None else 0,
+            "cache_misses": self.cache.misses if self.cache is not None else 0,
             "wait_time_analytics": {
                 "total_wait_time": round(total_wait_time, 2),
                 "average_page_load": round(avg_page_wait, 2),
@@ -818,47 +1263,122 @@ class AdvancedShoobCardScraper:
             }
         }
     
+    def _migrate_legacy_output(self) -> None:
+        """Convert a data.json left by earlier versions into the JSONL data file."""
+        data_file = self.data_file
+        legacy_file = data_file.with_suffix(".json")
+        
+        if self.config["output_format"] != "jsonl" or data_file.exists() or not legacy_file.exists():
+            return
+        
+        try:
+            with open(legacy_file, 'rb') as f:
+                legacy_cards = _json_loads(f.read()).get("cards", [])
+            # Write beside the target and swap it in, so a failed migration leaves nothing half-done
+            tmp_file = data_file.with_suffix(".jsonl.tmp")
+            with open(tmp_file, 'wb') as f:
+                for card in legacy_cards:
+                    f.write(_json_dumps(card) + b"\n")
+            tmp_file.replace(data_file)
+            legacy_file.unlink()
+            self.logger.info(f"📦 Migrated {len(legacy_cards)} cards from {legacy_file} to {data_file}")
+        except Exception as e:
+            self._log_to_file_only(f"Could not migrate legacy output {legacy_file}: {e}")
+    
+    def _open_output(self) -> None:
+        """Open the JSONL output once for appending."""
+        if self._out_fp is not None:
+            return
+        
+        data_file = self.data_file
+        
+        # Seed the running summary counters once; saves keep them current afterwards
+        if not self._output_scanned:
+            if data_file.exists():
+                self._cards_on_disk, self._sample_cards = self._scan_output(data_file)
+            self._output_scanned = True
+        
+        self._out_fp = open(data_file, 'ab', buffering=1 << 20)
+    
+    def _close_output(self) -> None:
+        """Close the JSONL output and page cursor files if they are open."""
+        if self._out_fp is not None:
+            self._out_fp.close()
+            self._out_fp = None
+        
+        if self._cursor_fp is not None:
+            self._cursor_fp.close()
+            self._cursor_fp = None
+    
+    def _append_cursor(self) -> None:
+        """Record newly saved pages in the cursor file (seeding it from process.json on first use)."""
+        new_pages = self.scraped_pages - self._cursor_pages
+        if not new_pages:
+            return
+        
+        if self._cursor_fp is None:
+            self._cursor_fp = open(OUTPUT_DIR / self.config["cursor_file"], 'a', encoding='utf-8', buffering=1)
+        
+        self._cursor_fp.write("".join(f"{page_num}\n" for page_num in sorted(new_pages)))
+        self._cursor_pages.update(new_pages)
+    
     def _save_final_output(self) -> Path:
-        """Save cards to data.json and progress to process.json."""
-        data_file = OUTPUT_DIR / "data.json"
+        """Save cards to the data file and progress to process.json."""
+        data_file = self.data_file
         process_file = OUTPUT_DIR / "process.json"
         
         try:
-            # Save simple data.json with just cards
-            data_output = {
-                "cards": self.all_cards,
-                "total": len(self.all_cards),
-                "last_updated": datetime.now(timezone.utc).isoformat()
-            }
-            
-            with open(data_file, 'w', encoding='utf-8') as f:
-                json.dump(
-                    data_output,
-                    f,
-                    ensure_ascii=False,
-                    indent=2 if self.config["pretty_print"] else None
-                )
+            if self.config["output_format"] == "jsonl":
+                # Append only the cards added since the last save
+                self._open_output()
+                new_cards = self.all_cards[self._saved_card_count:]
+                for card in new_cards:
+                    self._out_fp.write(_json_dumps(card) + b"\n")
+                self._out_fp.flush()
+                self._cards_on_disk += len(new_cards)
+                self._sample_cards.extend(new_cards[:3 - len(self._sample_cards)])
+                self._saved_card_count = len(self.all_cards)
+                total_cards = self._cards_on_disk
+            else:
+                # Rewrite data.json with earlier sessions' cards followed by this session's
+                if self._json_history is None:
+                    self._json_history = []
+                    if data_file.exists():
+                        with open(data_file, 'rb') as f:
+                            self._json_history = _json_loads(f.read()).get("cards", [])
+                
+                cards = self._json_history + self.all_cards
+                data_output = {
+                    "cards": cards,
+                    "total": len(cards),
+                    "last_updated": datetime.now(timezone.utc).isoformat()
+                }
+                
+                with open(data_file, 'wb') as f:
+                    f.write(_json_dumps(data_output, pretty=self.config["pretty_print"]))
+                self._cards_on_disk = len(cards)
+                self._sample_cards = cards[:3]
+                self._output_scanned = True
+                total_cards = self._cards_on_disk
             
             # Save process.json with progress tracking
             process_output = {
                 "scraped_pages": sorted(list(self.scraped_pages)),
                 "last_updated": datetime.now(timezone.utc).isoformat(),
-                "total_cards": len(self.all_cards),
+                "total_cards": total_cards,
                 "scraper_version": SCRAPER_VERSION,
                 "session_statistics": self._calculate_statistics()
             }
             
-            with open(process_file, 'w', encoding='utf-8') as f:
-                json.dump(
-                    process_output,
-                    f,
-                    ensure_ascii=False,
-                    indent=2 if self.config["pretty_print"] else None
-                )
+            with open(process_file, 'wb') as f:
+                f.write(_json_dumps(process_output, pretty=self.config["pretty_print"]))
+            
+            # Only mark pages as done once their cards are on disk
+            self._append_cursor()
             
-            self.logger.info(f"💾 Data saved to: {data_file}")
-            self.logger.info(f"📊 Progress saved to: {process_file}")
-            self.logger.info(f"🃏 Total cards: {len(self.all_cards)}")
+            self.logger.debug(f"💾 Data saved to: {data_file}")
+            self.logger.debug(f"📊 Progress saved to: {process_file}")
+            self.logger.debug(f"🃏 Total cards: {total_cards}")
             
             return data_file
             
@@ -866,8 +1386,21 @@ class AdvancedShoobCardScraper:
             self.logger.error(f"❌ Error saving output: {e}")
             raise
     
-    async def scrape_all_pages(self, start_page: Optional[int] = None, end_page: Optional[int] = None) -> Dict[str, Any]:
-        """Main scraping method with smart waiting and performance tracking."""
+    async def scrape_all_pages(
+        self,
+        start_page: Optional[int] = None,
+        end_page: Optional[int] = None,
+        on_page_done: Optional[Callable[[int, Optional[int]], None]] = None,
+        stop_event: Optional[asyncio.Event] = None
+    ) -> Dict[str, Any]:
+        """
+        Main scraping method with smart waiting and performance tracking.
+        
+        on_page_done, if given, is called as on_page_done(page_num, total_pages)
+        after each page finishes; total_pages is None in auto-detect mode.
+        Setting stop_event lets in-flight pages finish, then stops and saves.
+        """
+        self._shutdown_event = stop_event
         # Initialize
         self.stats["start_time"] = time.time()
         start_page = start_page or self.config["start_page"]
@@ -876,68 +1409,59 @@ class AdvancedShoobCardScraper:
         # Load previous progress
         self._load_progress()
         
-        # Setup browser
-        self.browser, self.context, self.page = await self._setup_browser()
-        
+        # Everything opened from here on is released by the finally block,
+        # even if the browser fails to launch
         try:
-            # Determine pages to scrape
-            if end_page is None:
-                end_page = 100  # Reasonable default
-                self.logger.info(f"📊 No end page specified, will scrape up to page {end_page}")
+            # Convert a legacy data.json, then create the data file up front so it
+            # exists even if this run saves nothing
+            if self.config["output_format"] == "jsonl":
+                self._migrate_legacy_output()
+                self._open_output()
             
-            pages_to_scrape = []
-            for page_num in range(start_page, end_page + 1):
-                if page_num not in self.scraped_pages:
-                    pages_to_scrape.append(page_num)
-                else:
-                    self.stats["pages_skipped"] += 1
+            # Open the URL result cache
+            if self.config["enable_cache"]:
+                self.cache = PageCache(OUTPUT_DIR / self.config["cache_file"], self.config["cache_ttl"])
+                self.logger.info(f"🗄️ Cache: {len(self.cache)} cached entries")
+            
+            # Setup browser
+            self.browser, self.context, self.page = await self._setup_browser()
+            await self._ensure_page_pool()
+            await self._warmup()
+            
+            # Determine pages to scrape (end_page=None means auto-detect)
+            if end_page is not None:
+                total_pages = sum(1 for page_num in range(start_page, end_page + 1) if page_num not in self.scraped_pages)
+            else:
+                total_pages = None
             
             self.logger.info(f"📊 Smart Scraping Plan:")
-            self.logger.info(f"   Pages range: {start_page} to {end_page}")
-            self.logger.info(f"   Pages to scrape: {len(pages_to_scrape)}")
+            if end_page is not None:
+                self.logger.info(f"   Pages range: {start_page} to {end_page}")
+                self.logger.info(f"   Pages to scrape: {total_pages}")
+            else:
+                self.logger.info(f"   Pages range: {start_page} until no more cards")
             self.logger.info(f"   Pages to skip: {len(self.scraped_pages)}")
+            self.logger.info(f"   Concurrency: up to {self.config['max_concurrency']} pages (adaptive)")
             self.logger.info(f"   Method: Event-driven smart waiting")
             self.logger.info("-" * 60)
             
-            # Check for consecutive errors
-            consecutive_error_limit = ERROR_CONFIG["max_consecutive_errors"]
+            # Feed page numbers through a bounded queue to a fixed set of workers,
+            # so only max_concurrency page coroutines are ever alive. The task group
+            # cancels the producer if a worker dies instead of blocking on a full queue.
+            worker_count = self.config["max_concurrency"]
+            queue: asyncio.Queue = asyncio.Queue(maxsize=worker_count)
+            self._stop_producing = False
+            async with asyncio.TaskGroup() as task_group:
+                for _ in range(worker_count):
+                    task_group.create_task(self._page_worker(queue, total_pages, on_page_done))
+                task_group.create_task(self._produce_pages(queue, start_page, end_page, worker_count))
             
-            # Scrape pages with smart waiting
-            for page_num in pages_to_scrape:
-                try:
-                    # Check consecutive error limit
-                    if self.stats["consecutive_errors"] >= consecutive_error_limit:
-                        self.logger.error(f"❌ Too many consecutive errors ({consecutive_error_limit}), stopping")
-                        break
-                    
-                    # Log which page we're scraping
-                    self.logger.info(f"🚀 Scraping page {page_num}")
-                    
-                    # Scrape the page with smart waiting
-                    await self._scrape_page(page_num)
-                    
-                    # Progress update
-                    if LOGGING_CONFIG["show_progress"]:
-                        progress = (len(self.scraped_pages) / len(pages_to_scrape)) * 100
-                        self.logger.info(f"📈 Progress: {progress:.1f}% ({len(self.scraped_pages)}/{len(pages_to_scrape)} pages)")
-                    
-                    # Minimal delay between pages (only for rate limiting)
-                    if page_num < max(pages_to_scrape):
-                        await asyncio.sleep(self.config["minimal_delay"])
-                    
-                except Exception as e:
-                    self._log_to_file_only(f"Critical error processing page {page_num}: {e}", "ERROR")
-                    self.stats["errors"] += 1
-                    self.stats["consecutive_errors"] += 1
-                    
-                    if ERROR_CONFIG["continue_on_error"]:
-                        await asyncio.sleep(ERROR_CONFIG["error_cooldown"])
-                        continue
-                    else:
-                        break
+            shutting_down = stop_event is not None and stop_event.is_set()
+            if shutting_down:
+                self.logger.warning("⚠️ Shutdown requested, stopped after in-flight pages")
             
-            # Retry failed cards if any
-            if self.failed_card_ids and len(self.failed_card_ids) <= 10:  # Only retry if reasonable number
+            # Retry failed cards if any (skipped when shutting down)
+            if not shutting_down and self.failed_card_ids and len(self.failed_card_ids) <= 10:  # Only retry if reasonable number
                 self.logger.info(f"🔄 Retrying {len(self.failed_card_ids)} failed cards...")
                 await self._retry_failed_cards()
             
@@ -969,6 +1493,7 @@ class AdvancedShoobCardScraper:
             # Save final output
             if self.all_cards:
                 output_file = self._save_final_output()
+                self._pending_pages.clear()
                 final_stats["output_file"] = str(output_file)
             else:
                 self.logger.warning("⚠️ No cards were extracted")
@@ -980,38 +1505,82 @@ class AdvancedShoobCardScraper:
             raise
             
         finally:
-            # Proper cleanup to prevent errors on exit
+            # Persist any buffered pages, then cleanup to prevent errors on exit
+            self.flush()
+            if self.cache is not None:
+                self.cache.close()
             await self._cleanup_browser()
     
+    def _scan_output(self, output_file: Path, sample_size: int = 3) -> tuple[int, List[Dict[str, Any]]]:
+        """Count cards in the output file and read the first few without loading it whole."""
+        if output_file.suffix == ".json":
+            with open(output_file, 'rb') as f:
+                cards = _json_loads(f.read()).get("cards", [])
+            return len(cards), cards[:sample_size]
+        
+        sample_cards = []
+        with open(output_file, 'rb') as f:
+            # Parse only the first few records, then count the remaining lines
+            for _ in range(sample_size):
+                line = f.readline()
+                if not line:
+                    break
+                sample_cards.append(_json_loads(line))
+            
+            total_cards = len(sample_cards)
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                total_cards += chunk.count(b"\n")
+        
+        return total_cards, sample_cards
+    
     def get_scraped_data_summary(self) -> Dict[str, Any]:
         """Get a summary of scraped data."""
-        output_file = OUTPUT_DIR / self.config["output_file"]
+        output_file = self.data_file
+        
+        # Standalone --summary runs have not loaded progress yet
+        if not self.scraped_pages:
+            self._load_progress()
+        
+        # One stat call answers both "does it exist" and "how big is it"; until the
+        # first scrape migrates it, existing data may still be in a legacy data.json
+        file_size = None
+        for candidate in (self.data_file, self.data_file.with_suffix(".json")):
+            try:
+                file_size = candidate.stat().st_size
+            except FileNotFoundError:
+                continue
+            output_file = candidate
+            break
         
         summary = {
-            "total_cards": len(self.all_cards),
+            "total_cards": 0,
             "scraped_pages": sorted(list(self.scraped_pages)),
-            "output_file": str(output_file) if output_file.exists() else None,
+            "output_file": str(output_file) if file_size is not None else None,
             "session_id": self.session_id,
             "last_updated": datetime.now(timezone.utc).isoformat(),
             "scraper_type": "advanced_event_driven"
         }
         
         # Add file info if exists
-        if output_file.exists():
+        if file_size is not None:
             try:
-                file_size = output_file.stat().st_size
-                summary["file_size_mb"] = round(file_size / (1024 * 1024), 2)
+                summary["file_size_mb"] = round(file_size / (1 << 20), 2)
+                
+                # Counters kept up to date while saving; only a standalone run scans the file
+                if not self._output_scanned:
+                    self._cards_on_disk, self._sample_cards = self._scan_output(output_file)
+                    self._output_scanned = True
                 
-                # Sample some cards for preview
-                if self.all_cards:
-                    sample_size = min(3, len(self.all_cards))
+                summary["total_cards"] = self._cards_on_disk
+                sample_cards = self._sample_cards
+                if sample_cards:
                     summary["sample_cards"] = [
                         {
                             "name": card.get("name", "Unknown"),
                             "tier": card.get("tier", "Unknown"),
                             "series": card.get("character_source", "Unknown")
                         }
-                        for card in self.all_cards[:sample_size]
+                        for card in sample_cards
                     ]
                     
             except Exception as e:
@@ -1029,12 +1598,10 @@ class AdvancedShoobCardScraper:
         
         for i, card_id in enumerate(failed_list, 1):
             try:
-                progress_text = f"🔄 Retrying failed cards: [{i}/{len(failed_list)}] ({i/len(failed_list)*100:.0f}%)"
-                sys.stderr.write(f"\r{progress_text:<60}")
-                sys.stderr.flush()
+                self.logger.debug(f"🔄 Retrying failed cards: [{i}/{len(failed_list)}]")
                 
                 card_url = f"{self.urls['site_url']}/cards/info/{card_id}"
-                card_data = await self._extract_card_data(card_url, None)  # Page unknown during retry
+                card_data = await self._extract_card_data(self.page, card_url, None)  # Page unknown during retry
                 
                 if card_data:
                     self.all_cards.append(card_data)
@@ -1046,10 +1613,8 @@ class AdvancedShoobCardScraper:
             except Exception as e:
                 self._log_to_file_only(f"Retry failed for card {card_id}: {e}", "ERROR")
         
-        # Clear progress line and show result
+        # Show result
         if retry_success > 0:
-            final_text = f"🔄 Retry completed: {retry_success}/{len(failed_list)} cards recovered"
+            self.logger.info(f"🔄 Retry completed: {retry_success}/{len(failed_list)} cards recovered")
         else:
-            final_text = f"🔄 Retry completed: No additional cards recovered"
-        sys.stderr.write(f"\r{final_text:<60}\n")
-        sys.stderr.flush()
+            self.logger.info(f"🔄 Retry completed: No additional cards recovered")